@@ -5,12 +5,20 @@ from scipy.optimize import minimize_scalar
 from sklearn.model_selection import cross_val_predict
 from sklearn.base import clone
 from sklearn.preprocessing import LabelEncoder
-from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
+from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV, ParameterSampler
 from sklearn.metrics import mean_squared_error
 
 from statsmodels.nonparametric.kde import KDEUnivariate
 
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
+
+try:
+    # the estimator tags are public since scikit-learn 1.6
+    from sklearn.utils import get_tags
+except ImportError:
+    # older versions only provide a private accessor
+    from sklearn.utils._tags import _safe_tags
+    get_tags = None
 
 from ._utils_checks import _check_is_partition
 
@@ -41,9 +49,16 @@ def _get_cond_smpls_2d(smpls, bin_var1, bin_var2):
     return smpls_00, smpls_01, smpls_10, smpls_11
 
 
-def _fit(estimator, x, y, train_index, idx=None):
-    estimator.fit(x[train_index, :], y[train_index])
-    return estimator, idx
+def _fit_and_predict(estimator, x, y, train_index, test_index, method, return_train_preds, idx=None):
+    x_train = x[train_index, :]
+    estimator.fit(x_train, y[train_index])
+    pred_fun = getattr(estimator, method)
+    test_preds = pred_fun(x[test_index, :])
+    if return_train_preds:
+        train_preds = pred_fun(x_train)
+    else:
+        train_preds = None
+    return estimator, test_preds, train_preds, idx
 
 
 def _dml_cv_predict(estimator, x, y, smpls=None,
@@ -73,96 +88,215 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             res['preds'] = preds
         res['targets'] = np.copy(y)
     else:
-        if not smpls_is_partition:
-            assert not fold_specific_target, 'combination of fold-specific y and no cross-fitting not implemented yet'
-            assert len(smpls) == 1
-
-        if method == 'predict_proba':
-            assert not fold_specific_target  # fold_specific_target only needed for PLIV.partialXZ
-            y = np.asarray(y)
-            le = LabelEncoder()
-            y = le.fit_transform(y)
+        estimators, y, y_list = _get_cv_estimators(estimator, y, smpls, n_obs, est_params, method,
+                                                   smpls_is_partition, fold_specific_target)
 
         parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+        # each fold is fitted and evaluated in a single job, such that the predictions are computed in parallel too
+        fitted_models = parallel(delayed(_fit_and_predict)(
+            estimators[idx], x, y_list[idx], train_index, test_index, method, return_train_preds, idx)
+                                 for idx, (train_index, test_index) in enumerate(smpls))
 
-        if fold_specific_target:
-            y_list = list()
-            for idx, (train_index, _) in enumerate(smpls):
-                xx = np.full(n_obs, np.nan)
-                xx[train_index] = y[idx]
-                y_list.append(xx)
+        res = _collect_cv_predictions(fitted_models, y, smpls, n_obs, method, fold_specific_target,
+                                      return_train_preds, return_models)
+
+    return res
+
+
+def _get_cv_estimators(estimator, y, smpls, n_obs, est_params, method, smpls_is_partition, fold_specific_target):
+    if not smpls_is_partition:
+        assert not fold_specific_target, 'combination of fold-specific y and no cross-fitting not implemented yet'
+        assert len(smpls) == 1
+
+    if method == 'predict_proba':
+        assert not fold_specific_target  # fold_specific_target only needed for PLIV.partialXZ
+        y = np.asarray(y)
+        le = LabelEncoder()
+        y = le.fit_transform(y)
+
+    if fold_specific_target:
+        y_list = list()
+        for idx, (train_index, _) in enumerate(smpls):
+            xx = np.full(n_obs, np.nan)
+            xx[train_index] = y[idx]
+            y_list.append(xx)
+    else:
+        # just replicate the y in a list
+        y_list = [y] * len(smpls)
+
+    if est_params is None:
+        estimators = [clone(estimator) for _ in smpls]
+    elif isinstance(est_params, dict):
+        # warnings.warn("Using the same (hyper-)parameters for all folds")
+        estimators = [clone(estimator).set_params(**est_params) for _ in smpls]
+    else:
+        assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        estimators = [clone(estimator).set_params(**est_params[idx]) for idx in range(len(smpls))]
+
+    return estimators, y, y_list
+
+
+def _collect_cv_predictions(fitted_models, y, smpls, n_obs, method, fold_specific_target,
+                            return_train_preds, return_models):
+    res = {'models': None}
+    # multi-output learners are fitted on two-dimensional targets
+    if fold_specific_target:
+        preds_shape = (n_obs,)
+    else:
+        preds_shape = (n_obs,) + np.shape(y)[1:]
+    preds = np.full(preds_shape, np.nan)
+    targets = np.full(preds_shape, np.nan)
+    train_preds = list()
+    train_targets = list()
+    for idx, (train_index, test_index) in enumerate(smpls):
+        assert idx == fitted_models[idx][3]
+        if method == 'predict_proba':
+            preds[test_index] = fitted_models[idx][1][:, 1]
         else:
-            # just replicate the y in a list
-            y_list = [y] * len(smpls)
+            preds[test_index] = fitted_models[idx][1]
 
-        if est_params is None:
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
-        elif isinstance(est_params, dict):
-            # warnings.warn("Using the same (hyper-)parameters for all folds")
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
+        if fold_specific_target:
+            # targets not available for fold specific target
+            targets = None
         else:
-            assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params[idx]), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
-
-        preds = np.full(n_obs, np.nan)
-        targets = np.full(n_obs, np.nan)
-        train_preds = list()
-        train_targets = list()
-        for idx, (train_index, test_index) in enumerate(smpls):
-            assert idx == fitted_models[idx][1]
-            pred_fun = getattr(fitted_models[idx][0], method)
-            if method == 'predict_proba':
-                preds[test_index] = pred_fun(x[test_index, :])[:, 1]
-            else:
-                preds[test_index] = pred_fun(x[test_index, :])
-
-            if fold_specific_target:
-                # targets not available for fold specific target
-                targets = None
-            else:
-                targets[test_index] = y[test_index]
-
-            if return_train_preds:
-                train_preds.append(pred_fun(x[train_index, :]))
-                train_targets.append(y[train_index])
-
-        res['preds'] = preds
-        res['targets'] = targets
+            targets[test_index] = y[test_index]
+
         if return_train_preds:
-            res['train_preds'] = train_preds
-            res['train_targets'] = train_targets
-        if return_models:
-            fold_ids = [xx[1] for xx in fitted_models]
-            if not np.alltrue(fold_ids == np.arange(len(smpls))):
-                raise RuntimeError('export of fitted models failed')
-            res['models'] = [xx[0] for xx in fitted_models]
+            train_preds.append(fitted_models[idx][2])
+            train_targets.append(y[train_index])
+
+    res['preds'] = preds
+    res['targets'] = targets
+    if return_train_preds:
+        res['train_preds'] = train_preds
+        res['train_targets'] = train_targets
+    if return_models:
+        fold_ids = [xx[3] for xx in fitted_models]
+        if not np.alltrue(fold_ids == np.arange(len(smpls))):
+            raise RuntimeError('export of fitted models failed')
+        res['models'] = [xx[0] for xx in fitted_models]
 
     return res
 
 
-def _dml_tune(y, x, train_inds,
-              learner, param_grid, scoring_method,
-              n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
-    tune_res = list()
+def _get_nested_n_jobs(n_jobs, n_tasks):
+    # split the available CPUs between independent tasks (outer level) and the jobs within each task (inner level)
+    if n_jobs is None:
+        return None, None
+    n_jobs_total = effective_n_jobs(n_jobs)
+    n_jobs_outer = min(n_tasks, n_jobs_total)
+    n_jobs_inner = max(1, n_jobs_total // n_jobs_outer)
+    return n_jobs_outer, n_jobs_inner
+
+
+def _dml_cv_predict_multi(learners, x, targets, smpls=None,
+                          n_jobs=None, est_params=None, methods=None, return_models=False):
+    # cross-fitting of several nuisance learners on the same covariates, the learners are dict-keyed by their names
+    if est_params is None:
+        est_params = {key: None for key in learners}
+    if methods is None:
+        methods = {key: 'predict' for key in learners}
+    n_obs = x.shape[0]
+    n_folds = len(smpls)
+
+    smpls_is_partition = _check_is_partition(smpls, n_obs)
+    fold_specific_target = {key: isinstance(targets[key], list) for key in learners}
+    cv_estimators = {key: _get_cv_estimators(learners[key], targets[key], smpls, n_obs, est_params[key], methods[key],
+                                             smpls_is_partition, fold_specific_target[key])
+                     for key in learners}
+
+    # all learner-fold combinations are fitted in a single pool; the jobs are ordered learner by learner such that a
+    # sequential run fits the learners in the same order as separate calls of _dml_cv_predict
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    fitted_models = parallel(delayed(_fit_and_predict)(
+        cv_estimators[key][0][idx], x, cv_estimators[key][2][idx], train_index, test_index, methods[key], False, idx)
+                             for key in learners
+                             for idx, (train_index, test_index) in enumerate(smpls))
+
+    res = dict()
+    for i_learner, key in enumerate(learners):
+        res[key] = _collect_cv_predictions(fitted_models[i_learner * n_folds:(i_learner + 1) * n_folds],
+                                           cv_estimators[key][1], smpls, n_obs, methods[key],
+                                           fold_specific_target[key], False, return_models)
+
+    return res
+
+
+def _fit_tune_search(search, x, y, train_index):
+    return search.fit(x[train_index, :], y[train_index])
+
+
+def _get_tune_searches(train_inds, learner, param_grid, scoring_method,
+                       n_folds_tune, n_jobs_search, search_mode, n_iter_randomized_search, draw_splits):
+    # the shuffled splits are redrawn on every call of split(), so one resampling object serves all folds
+    tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
+    searches = list()
     for train_index in train_inds:
-        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
+        search_random_state = None
+        if draw_splits:
+            # draw the candidates and splits before dispatching, such that they do not depend on the random state of
+            # the workers; they are drawn in the same order from the global random state as in a sequential fit.
+            # Without dispatching, they are drawn lazily such that learners drawing from the global random state
+            # when fitted see the same random stream as before
+            if search_mode == 'randomized_search':
+                search_random_state = np.random.RandomState()
+                search_random_state.set_state(np.random.get_state())
+                _ = list(ParameterSampler(param_grid, n_iter_randomized_search))
+            tune_cv = list(tune_resampling.split(train_index))
+        else:
+            tune_cv = tune_resampling
         if search_mode == 'grid_search':
             g_grid_search = GridSearchCV(learner, param_grid,
                                          scoring=scoring_method,
-                                         cv=tune_resampling, n_jobs=n_jobs_cv)
+                                         cv=tune_cv, n_jobs=n_jobs_search)
         else:
             assert search_mode == 'randomized_search'
             g_grid_search = RandomizedSearchCV(learner, param_grid,
                                                scoring=scoring_method,
-                                               cv=tune_resampling, n_jobs=n_jobs_cv,
-                                               n_iter=n_iter_randomized_search)
-        tune_res.append(g_grid_search.fit(x[train_index, :], y[train_index]))
+                                               cv=tune_cv, n_jobs=n_jobs_search,
+                                               n_iter=n_iter_randomized_search,
+                                               random_state=search_random_state)
+        searches.append(g_grid_search)
+
+    return searches
+
+
+def _dml_tune(y, x, train_inds,
+              learner, param_grid, scoring_method,
+              n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
+    # the folds are tuned in parallel, the remaining jobs are used by the searches within each fold
+    n_jobs_folds, n_jobs_search = _get_nested_n_jobs(n_jobs_cv, len(train_inds))
+    searches = _get_tune_searches(train_inds, learner, param_grid, scoring_method,
+                                  n_folds_tune, n_jobs_search, search_mode, n_iter_randomized_search,
+                                  draw_splits=(n_jobs_folds is not None) and (n_jobs_folds > 1))
+
+    parallel = Parallel(n_jobs=n_jobs_folds, verbose=0, pre_dispatch='2*n_jobs')
+    tune_res = parallel(delayed(_fit_tune_search)(searches[idx], x, y, train_index)
+                        for idx, train_index in enumerate(train_inds))
+
+    return tune_res
+
+
+def _dml_tune_multi(targets, x, train_inds,
+                    learners, param_grids, scoring_methods,
+                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
+    # tuning of several nuisance learners on the same covariates, the learners are dict-keyed by their names
+    n_folds = len(train_inds)
+    n_jobs_searches, n_jobs_search = _get_nested_n_jobs(n_jobs_cv, len(learners) * n_folds)
+    # all searches are set up in the main process learner by learner, such that the inner splits of dispatched searches
+    # are drawn in the same order as in a sequential run
+    searches = {key: _get_tune_searches(train_inds, learners[key], param_grids[key], scoring_methods[key],
+                                        n_folds_tune, n_jobs_search, search_mode, n_iter_randomized_search,
+                                        draw_splits=(n_jobs_searches is not None) and (n_jobs_searches > 1))
+                for key in learners}
+
+    parallel = Parallel(n_jobs=n_jobs_searches, verbose=0, pre_dispatch='2*n_jobs')
+    fitted_searches = parallel(delayed(_fit_tune_search)(searches[key][idx], x, targets[key], train_index)
+                               for key in learners
+                               for idx, train_index in enumerate(train_inds))
+
+    tune_res = {key: fitted_searches[i_learner * n_folds:(i_learner + 1) * n_folds]
+                for i_learner, key in enumerate(learners)}
 
     return tune_res
 
@@ -275,7 +409,8 @@ def _var_est(psi, psi_deriv, apply_cross_fitting, smpls, is_cluster_data,
             var_scaling_factor = len(test_index)
 
         J = np.mean(psi_deriv)
-        gamma_hat = np.mean(np.square(psi))
+        # psi is one-dimensional, such that the sum of squares is a single BLAS dot product
+        gamma_hat = np.dot(psi, psi) / psi.shape[0]
 
     else:
         assert cluster_vars is not None
@@ -339,3 +474,22 @@ def _cond_targets(target, cond_sample):
     cond_target = target.astype(float)
     cond_target[np.invert(cond_sample)] = np.nan
     return cond_target
+
+
+def _supports_multi_output(learner):
+    if get_tags is None:
+        return _safe_tags(learner, key='multioutput')
+    return get_tags(learner).target_tags.multi_output
+
+
+def _params_equal(params_1, params_2):
+    # element-wise comparison of (nested) hyperparameters, the values may be arrays for which == is ambiguous
+    if isinstance(params_1, dict) and isinstance(params_2, dict):
+        return (params_1.keys() == params_2.keys()) and \
+            all(_params_equal(params_1[key], params_2[key]) for key in params_1)
+    if isinstance(params_1, (list, tuple)) and isinstance(params_2, (list, tuple)):
+        return (len(params_1) == len(params_2)) and \
+            all(_params_equal(par_1, par_2) for par_1, par_2 in zip(params_1, params_2))
+    if isinstance(params_1, np.ndarray) or isinstance(params_2, np.ndarray):
+        return np.array_equal(params_1, params_2)
+    return params_1 == params_2
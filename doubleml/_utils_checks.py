@@ -1,6 +1,7 @@
 import numpy as np
 import warnings
 
+from sklearn.utils import assert_all_finite, check_consistent_length, column_or_1d
 from sklearn.utils.multiclass import type_of_target
 
 
@@ -126,6 +127,14 @@ def _check_finite_predictions(preds, learner, learner_name, smpls):
     return
 
 
+def _check_target(target, x):
+    # validates an additional target against the already validated covariates x, such that x is not checked again
+    target = column_or_1d(target, warn=True)
+    assert_all_finite(target)
+    check_consistent_length(x, target)
+    return target
+
+
 def _check_score(score, valid_score, allow_callable=True):
     if isinstance(score, str):
         if score not in valid_score:
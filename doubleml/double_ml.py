@@ -1455,9 +1455,7 @@ class DoubleML(ABC):
 
         if dml_procedure == 'dml1':
             # Note that len(smpls) is only not equal to self.n_folds if self.apply_cross_fitting = False
-            dml1_coefs = np.zeros(len(smpls))
-            for idx, (_, test_index) in enumerate(smpls):
-                dml1_coefs[idx] = self._est_coef(psi_elements, inds=test_index)
+            dml1_coefs = self._est_dml1_coefs(psi_elements, smpls)
             coef = np.mean(dml1_coefs)
         else:
             assert dml_procedure == 'dml2'
@@ -1473,6 +1471,11 @@ class DoubleML(ABC):
 
         return coef, dml1_coefs
 
+    def _est_dml1_coefs(self, psi_elements, smpls):
+        dml1_coefs = np.fromiter((self._est_coef(psi_elements, inds=test_index) for _, test_index in smpls),
+                                 dtype=np.float64, count=len(smpls))
+        return dml1_coefs
+
     def _se_causal_pars(self):
         if not self._is_cluster_data:
             cluster_vars = None
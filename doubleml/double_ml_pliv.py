@@ -2,7 +2,6 @@ import numpy as np
 from sklearn.utils import check_X_y
 from sklearn.model_selection import KFold
 from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
-from sklearn.linear_model import LinearRegression
 from sklearn.dummy import DummyRegressor
 
 import warnings
@@ -11,8 +10,8 @@ from .double_ml import DoubleML
 from .double_ml_data import DoubleMLData
 from .double_ml_score_mixins import LinearScoreMixin
 
-from ._utils import _dml_cv_predict, _dml_tune
-from ._utils_checks import _check_finite_predictions
+from ._utils import _dml_cv_predict, _dml_cv_predict_multi, _dml_tune, _dml_tune_multi
+from ._utils_checks import _check_finite_predictions, _check_target
 
 
 class DoubleMLPLIV(LinearScoreMixin, DoubleML):
@@ -313,80 +312,55 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
     def _nuisance_est_partial_x(self, smpls, n_jobs_cv, external_predictions, return_models=False):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
-
-        # nuisance l
-        if external_predictions['ml_l'] is not None:
-            l_hat = {'preds': external_predictions['ml_l'],
-                     'targets': None,
-                     'models': None}
-        else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
-        _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
+        d = _check_target(self._dml_data.d, x)
 
-        predictions = {'ml_l': l_hat['preds']}
-        targets = {'ml_l': l_hat['targets']}
-        models = {'ml_l': l_hat['models']}
-        # nuisance m
         if self._dml_data.n_instr == 1:
             # one instrument: just identified
-            x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                             force_all_finite=False)
-            if external_predictions['ml_m'] is not None:
-                m_hat = {'preds': external_predictions['ml_m'],
-                         'targets': None,
-                         'models': None}
-            else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
-            predictions['ml_m'] = m_hat['preds']
-            targets['ml_m'] = m_hat['targets']
-            models['ml_m'] = m_hat['models']
+            z = _check_target(np.ravel(self._dml_data.z), x)
+            m_targets = {'ml_m': z}
         else:
             # several instruments: 2SLS
-            m_hat = {'preds': np.full((self._dml_data.n_obs, self._dml_data.n_instr), np.nan),
-                     'targets': [None] * self._dml_data.n_instr,
-                     'models': [None] * self._dml_data.n_instr}
+            z = self._dml_data.z
+            m_targets = dict()
             for i_instr in range(self._dml_data.n_instr):
-                z = self._dml_data.z
-                x, this_z = check_X_y(x, z[:, i_instr],
-                                      force_all_finite=False)
-                if external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]] is not None:
-                    m_hat['preds'][:, i_instr] = external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]]
-                    predictions['ml_m_' + self._dml_data.z_cols[i_instr]] = external_predictions[
-                        'ml_m_' + self._dml_data.z_cols[i_instr]]
-                    targets['ml_m_' + self._dml_data.z_cols[i_instr]] = None
-                    models['ml_m_' + self._dml_data.z_cols[i_instr]] = None
-                else:
-                    res_cv_predict = _dml_cv_predict(self._learner['ml_m'], x, this_z, smpls=smpls, n_jobs=n_jobs_cv,
-                                                     est_params=self._get_params('ml_m_' + self._dml_data.z_cols[i_instr]),
-                                                     method=self._predict_method['ml_m'], return_models=return_models)
-
-                    m_hat['preds'][:, i_instr] = res_cv_predict['preds']
+                this_z = _check_target(z[:, i_instr], x)
+                m_targets['ml_m_' + self._dml_data.z_cols[i_instr]] = this_z
+        nuisance_targets = {'ml_l': y, **m_targets, 'ml_r': d}
+        learner_names = {key: 'ml_m' if key in m_targets else key for key in nuisance_targets}
+
+        # the nuisance functions l, m and r do not depend on each other and are estimated in parallel
+        est_keys = [key for key in nuisance_targets if external_predictions[key] is None]
+        nuisance_res = _dml_cv_predict_multi({key: self._learner[learner_names[key]] for key in est_keys},
+                                             x, {key: nuisance_targets[key] for key in est_keys},
+                                             smpls=smpls, n_jobs=n_jobs_cv,
+                                             est_params={key: self._get_params(key) for key in est_keys},
+                                             methods={key: self._predict_method[learner_names[key]]
+                                                      for key in est_keys},
+                                             return_models=return_models)
+        for key in nuisance_targets:
+            if key not in est_keys:
+                nuisance_res[key] = {'preds': external_predictions[key],
+                                     'targets': None,
+                                     'models': None}
+
+        predictions = {key: nuisance_res[key]['preds'] for key in nuisance_targets}
+        targets = {key: nuisance_res[key]['targets'] for key in nuisance_targets}
+        models = {key: nuisance_res[key]['models'] for key in nuisance_targets}
 
-                    predictions['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['preds']
-                    targets['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['targets']
-                    models['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['models']
+        # nuisance l
+        l_hat = nuisance_res['ml_l']
+        _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
+        # nuisance m
+        if self._dml_data.n_instr == 1:
+            m_hat = nuisance_res['ml_m']
+        else:
+            m_hat = {'preds': np.column_stack([nuisance_res[key]['preds'] for key in m_targets])}
         _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
         # nuisance r
-        if external_predictions['ml_r'] is not None:
-            r_hat = {'preds': external_predictions['ml_r'],
-                     'targets': None,
-                     'models': None}
-        else:
-            r_hat = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                    return_models=return_models)
+        r_hat = nuisance_res['ml_r']
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
-        predictions['ml_r'] = r_hat['preds']
-        targets['ml_r'] = r_hat['targets']
-        models['ml_r'] = r_hat['models']
 
         g_hat = {'preds': None, 'targets': None, 'models': None}
         if (self._dml_data.n_instr == 1) & ('ml_g' in self._learner):
@@ -397,9 +371,9 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                          'targets': None,
                          'models': None}
             else:
-                psi_a = -np.multiply(d - r_hat['preds'], z - m_hat['preds'])
-                psi_b = np.multiply(z - m_hat['preds'], y - l_hat['preds'])
-                theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
+                v_hat = z - m_hat['preds']
+                theta_initial = np.nanmean(np.multiply(v_hat, y - l_hat['preds'])) / \
+                    np.nanmean(np.multiply(v_hat, d - r_hat['preds']))
                 # nuisance g
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial * d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
@@ -422,32 +396,39 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return psi_elements, predictions
 
     def _score_elements(self, y, z, d, l_hat, m_hat, r_hat, g_hat, smpls):
-        # compute residuals
-        u_hat = y - l_hat
-        w_hat = d - r_hat
-        v_hat = z - m_hat
-
-        r_hat_tilde = None
-        if self._dml_data.n_instr > 1:
-            assert self.apply_cross_fitting
-            # TODO check whether the no cross-fitting case can be supported here
-            # projection of w_hat on v_hat
-            reg = LinearRegression(fit_intercept=True).fit(v_hat, w_hat)
-            r_hat_tilde = reg.predict(v_hat)
-
         if isinstance(self.score, str):
+            # only the residuals entering the score are computed; the score elements are written into the residual
+            # arrays to avoid additional temporary arrays
             if self._dml_data.n_instr == 1:
+                # the residuals holding the score elements are rows of a single buffer
+                score_buffer = np.empty((2, y.shape[0]))
                 if self.score == 'partialling out':
-                    psi_a = -np.multiply(w_hat, v_hat)
-                    psi_b = np.multiply(v_hat, u_hat)
+                    v_hat = z - m_hat
+                    w_hat = np.subtract(d, r_hat, out=score_buffer[0])
+                    u_hat = np.subtract(y, l_hat, out=score_buffer[1])
+                    psi_a = np.multiply(w_hat, v_hat, out=w_hat)
+                    psi_b = np.multiply(v_hat, u_hat, out=u_hat)
                 else:
                     assert self.score == 'IV-type'
-                    psi_a = -np.multiply(v_hat, d)
-                    psi_b = np.multiply(v_hat, y - g_hat)
+                    v_hat = np.subtract(z, m_hat, out=score_buffer[0])
+                    u_hat = np.subtract(y, g_hat, out=score_buffer[1])
+                    psi_b = np.multiply(v_hat, u_hat, out=u_hat)
+                    psi_a = np.multiply(v_hat, d, out=v_hat)
             else:
                 assert self.score == 'partialling out'
-                psi_a = -np.multiply(w_hat, r_hat_tilde)
-                psi_b = np.multiply(r_hat_tilde, u_hat)
+                assert self.apply_cross_fitting
+                # TODO check whether the no cross-fitting case can be supported here
+                u_hat = y - l_hat
+                w_hat = d - r_hat
+                v_hat = z - m_hat
+                # projection of w_hat on v_hat (least squares with intercept, solved on the centered residuals)
+                v_hat_centered = np.subtract(v_hat, np.mean(v_hat, axis=0), out=v_hat)
+                w_hat_mean = np.mean(w_hat)
+                coef = np.linalg.lstsq(v_hat_centered, w_hat - w_hat_mean, rcond=None)[0]
+                r_hat_tilde = np.dot(v_hat_centered, coef) + w_hat_mean
+                psi_a = np.multiply(w_hat, r_hat_tilde, out=w_hat)
+                psi_b = np.multiply(r_hat_tilde, u_hat, out=u_hat)
+            np.negative(psi_a, out=psi_a)
         else:
             assert callable(self.score)
             if self._dml_data.n_instr > 1:
@@ -475,7 +456,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
 
         if isinstance(self.score, str):
             assert self.score == 'partialling out'
-            psi_a = -np.multiply(r_hat['preds'], d)
+            psi_a = np.multiply(r_hat['preds'], d)
+            np.negative(psi_a, out=psi_a)
             psi_b = np.multiply(r_hat['preds'], y)
         else:
             assert callable(self.score)
@@ -495,8 +477,6 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
                           self._dml_data.d,
                           force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
 
         # nuisance l
         l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
@@ -519,11 +499,14 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # compute residuals
         u_hat = y - l_hat['preds']
         w_hat = d - m_hat_tilde['preds']
+        v_hat = m_hat['preds'] - m_hat_tilde['preds']
 
         if isinstance(self.score, str):
             assert self.score == 'partialling out'
-            psi_a = -np.multiply(w_hat, (m_hat['preds']-m_hat_tilde['preds']))
-            psi_b = np.multiply((m_hat['preds']-m_hat_tilde['preds']), u_hat)
+            # the score elements are written into the residual arrays to avoid additional temporary arrays
+            psi_a = np.multiply(w_hat, v_hat, out=w_hat)
+            np.negative(psi_a, out=psi_a)
+            psi_b = np.multiply(v_hat, u_hat, out=u_hat)
         else:
             assert callable(self.score)
             raise NotImplementedError('Callable score not implemented for DoubleMLPLIV.partialXZ.')
@@ -547,8 +530,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                                    search_mode, n_iter_randomized_search):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        d = _check_target(self._dml_data.d, x)
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
@@ -556,34 +538,34 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                                'ml_r': None,
                                'ml_g': None}
 
-        train_inds = [train_index for (train_index, _) in smpls]
-        l_tune_res = _dml_tune(y, x, train_inds,
-                               self._learner['ml_l'], param_grids['ml_l'], scoring_methods['ml_l'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
-
         if self._dml_data.n_instr > 1:
             # several instruments: 2SLS
-            m_tune_res = {instr_var: list() for instr_var in self._dml_data.z_cols}
             z = self._dml_data.z
+            m_targets = dict()
             for i_instr in range(self._dml_data.n_instr):
-                x, this_z = check_X_y(x, z[:, i_instr],
-                                      force_all_finite=False)
-                m_tune_res[self._dml_data.z_cols[i_instr]] = _dml_tune(this_z, x, train_inds,
-                                                                       self._learner['ml_m'], param_grids['ml_m'],
-                                                                       scoring_methods['ml_m'],
-                                                                       n_folds_tune, n_jobs_cv, search_mode,
-                                                                       n_iter_randomized_search)
+                this_z = _check_target(z[:, i_instr], x)
+                m_targets['ml_m_' + self._dml_data.z_cols[i_instr]] = this_z
         else:
             # one instrument: just identified
-            x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                             force_all_finite=False)
-            m_tune_res = _dml_tune(z, x, train_inds,
-                                   self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+            z = _check_target(np.ravel(self._dml_data.z), x)
+            m_targets = {'ml_m': z}
+        tune_targets = {'ml_l': y, **m_targets, 'ml_r': d}
+        learner_names = {key: 'ml_m' if key in m_targets else key for key in tune_targets}
 
-        r_tune_res = _dml_tune(d, x, train_inds,
-                               self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+        # the nuisance learners l, m and r do not depend on each other and are tuned in parallel
+        train_inds = [train_index for (train_index, _) in smpls]
+        all_tune_res = _dml_tune_multi(tune_targets, x, train_inds,
+                                       {key: self._learner[learner_names[key]] for key in tune_targets},
+                                       {key: param_grids[learner_names[key]] for key in tune_targets},
+                                       {key: scoring_methods[learner_names[key]] for key in tune_targets},
+                                       n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+
+        l_tune_res = all_tune_res['ml_l']
+        r_tune_res = all_tune_res['ml_r']
+        if self._dml_data.n_instr > 1:
+            m_tune_res = {instr_var: all_tune_res['ml_m_' + instr_var] for instr_var in self._dml_data.z_cols}
+        else:
+            m_tune_res = all_tune_res['ml_m']
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
         r_best_params = [xx.best_params_ for xx in r_tune_res]
@@ -604,12 +586,12 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                 m_hat = np.full_like(z, np.nan)
                 r_hat = np.full_like(d, np.nan)
                 for idx, (train_index, _) in enumerate(smpls):
-                    l_hat[train_index] = l_tune_res[idx].predict(x[train_index, :])
-                    m_hat[train_index] = m_tune_res[idx].predict(x[train_index, :])
-                    r_hat[train_index] = r_tune_res[idx].predict(x[train_index, :])
-                psi_a = -np.multiply(d - r_hat, z - m_hat)
-                psi_b = np.multiply(z - m_hat, y - l_hat)
-                theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
+                    x_train = x[train_index, :]
+                    l_hat[train_index] = l_tune_res[idx].predict(x_train)
+                    m_hat[train_index] = m_tune_res[idx].predict(x_train)
+                    r_hat[train_index] = r_tune_res[idx].predict(x_train)
+                v_hat = z - m_hat
+                theta_initial = np.nanmean(np.multiply(v_hat, y - l_hat)) / np.nanmean(np.multiply(v_hat, d - r_hat))
                 g_tune_res = _dml_tune(y - theta_initial * d, x, train_inds,
                                        self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
                                        n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
@@ -668,8 +650,6 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
                           self._dml_data.d,
                           force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
@@ -685,9 +665,9 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
 
         r_tune_res = list()
+        r_tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
         for idx, (train_index, _) in enumerate(smpls):
             m_hat = m_tune_res[idx].predict(xz[train_index, :])
-            r_tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
             if search_mode == 'grid_search':
                 r_grid_search = GridSearchCV(self._learner['ml_r'], param_grids['ml_r'],
                                              scoring=scoring_methods['ml_r'],
@@ -11,8 +11,9 @@ from .double_ml_data import DoubleMLData
 from .double_ml_score_mixins import LinearScoreMixin
 from .double_ml_blp import DoubleMLBLP
 
-from ._utils import _dml_cv_predict, _dml_tune
-from ._utils_checks import _check_score, _check_finite_predictions, _check_is_propensity
+from ._utils import _dml_cv_predict, _dml_cv_predict_multi, _dml_tune, _dml_tune_multi, _params_equal, \
+    _supports_multi_output
+from ._utils_checks import _check_score, _check_finite_predictions, _check_is_propensity, _check_target
 
 
 class DoubleMLPLR(LinearScoreMixin, DoubleML):
@@ -66,6 +67,14 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         Indicates whether cross-fitting should be applied.
         Default is ``True``.
 
+    merge_nuisance : bool
+        Indicates whether the nuisance functions :math:`\\ell_0(X)` and :math:`m_0(X)` are estimated jointly by a
+        single multi-output fit of ``ml_l`` on :math:`(Y, D)`. The joint fit is only used if ``ml_l`` and ``ml_m`` are
+        regressors of the same type with identical parameters which support multi-output regression; otherwise they are
+        fitted separately.
+        Note that for learners like random forests the joint fit results in different predictions than separate fits.
+        Default is ``False``.
+
     Examples
     --------
     >>> import numpy as np
@@ -108,7 +117,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                  score='partialling out',
                  dml_procedure='dml2',
                  draw_sample_splitting=True,
-                 apply_cross_fitting=True):
+                 apply_cross_fitting=True,
+                 merge_nuisance=False):
         super().__init__(obj_dml_data,
                          n_folds,
                          n_rep,
@@ -153,6 +163,19 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         self._initialize_ml_nuisance_params()
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._l_hat_cache = None
+
+        if not isinstance(merge_nuisance, bool):
+            raise TypeError('merge_nuisance must be True or False. '
+                            f'Got {str(merge_nuisance)}.')
+        self._merge_nuisance = merge_nuisance
+
+    @property
+    def merge_nuisance(self):
+        """
+        Indicates whether identical learners for the nuisance functions l and m are fitted jointly.
+        """
+        return self._merge_nuisance
 
     def _initialize_ml_nuisance_params(self):
         self._params = {learner: {key: [None] * self.n_rep for key in self._dml_data.d_cols}
@@ -172,8 +195,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        d = _check_target(self._dml_data.d, x)
         m_external = external_predictions['ml_m'] is not None
         l_external = external_predictions['ml_l'] is not None
         if 'ml_g' in self._learner:
@@ -181,6 +203,38 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         else:
             g_external = False
 
+        # if the other treatment variables are not used as covariates, the nuisance function l does not depend on the
+        # treatment variable and its cross-fitted predictions are shared among all treatments of a repetition
+        share_l_hat = (self._dml_data.n_treat > 1) & (not self._dml_data.use_other_treat_as_covariate)
+        if self._i_treat == 0:
+            self._l_hat_cache = None
+        l_cached = share_l_hat and (self._l_hat_cache is not None) and \
+            _params_equal(self._l_hat_cache['params'], self._get_params('ml_l'))
+
+        # the nuisance functions l and m do not depend on each other and are estimated in parallel
+        nuisance_targets = {'ml_l': y, 'ml_m': d}
+        est_keys = list()
+        if not (l_external or (self._score == "IV-type" and g_external) or l_cached):
+            est_keys.append('ml_l')
+        if not m_external:
+            est_keys.append('ml_m')
+        if (est_keys == ['ml_l', 'ml_m']) and self._merge_l_m():
+            # identical regressors for l and m are fitted jointly as a multi-output learner on (y, d)
+            l_m_hat = _dml_cv_predict(self._learner['ml_l'], x, np.column_stack((y, d)), smpls=smpls,
+                                      n_jobs=n_jobs_cv, est_params=self._get_params('ml_l'),
+                                      method=self._predict_method['ml_l'], return_models=return_models)
+            nuisance_res = {key: {'preds': l_m_hat['preds'][:, i_target],
+                                  'targets': l_m_hat['targets'][:, i_target],
+                                  'models': l_m_hat['models']}
+                            for i_target, key in enumerate(est_keys)}
+        else:
+            nuisance_res = _dml_cv_predict_multi({key: self._learner[key] for key in est_keys},
+                                                 x, {key: nuisance_targets[key] for key in est_keys},
+                                                 smpls=smpls, n_jobs=n_jobs_cv,
+                                                 est_params={key: self._get_params(key) for key in est_keys},
+                                                 methods={key: self._predict_method[key] for key in est_keys},
+                                                 return_models=return_models)
+
         # nuisance l
         if l_external:
             l_hat = {'preds': external_predictions['ml_l'],
@@ -190,11 +244,17 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             l_hat = {'preds': None,
                      'targets': None,
                      'models': None}
+        elif l_cached:
+            l_hat = self._l_hat_cache['l_hat']
         else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+            l_hat = nuisance_res['ml_l']
             _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
+            if share_l_hat:
+                self._l_hat_cache = {'params': self._get_params('ml_l'),
+                                     'l_hat': l_hat}
+        if self._i_treat == self._dml_data.n_treat - 1:
+            # the predictions (and models) are not kept beyond the last treatment variable of a repetition
+            self._l_hat_cache = None
 
         # nuisance m
         if m_external:
@@ -202,9 +262,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
         if self._check_learner(self._learner['ml_m'], 'ml_m', regressor=True, classifier=True):
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
@@ -228,9 +286,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                          'models': None}
             else:
                 # get an initial estimate for theta using the partialling out score
-                psi_a = -np.multiply(d - m_hat['preds'], d - m_hat['preds'])
-                psi_b = np.multiply(d - m_hat['preds'], y - l_hat['preds'])
-                theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
+                v_hat = d - m_hat['preds']
+                theta_initial = np.nanmean(np.multiply(v_hat, y - l_hat['preds'])) / np.nanmean(np.square(v_hat))
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial*d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
                                         return_models=return_models)
@@ -251,19 +308,32 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
 
         return psi_elements, preds
 
-    def _score_elements(self, y, d, l_hat, m_hat, g_hat, smpls):
-        # compute residual
-        v_hat = d - m_hat
+    def _merge_l_m(self):
+        if not self.merge_nuisance or (self._predict_method['ml_m'] != 'predict'):
+            return False
+        ml_l = self._learner['ml_l']
+        ml_m = self._learner['ml_m']
+        same_learner = (type(ml_l) is type(ml_m)) and _params_equal(ml_l.get_params(), ml_m.get_params())
+        # learners without multi-output support (e.g. gradient boosting or support vector regression) are fitted separately
+        return same_learner and _supports_multi_output(ml_l) and \
+            _params_equal(self._get_params('ml_l'), self._get_params('ml_m'))
 
+    def _score_elements(self, y, d, l_hat, m_hat, g_hat, smpls):
         if isinstance(self.score, str):
+            # the residuals are computed into the rows of a single buffer, which are then overwritten by the score
+            # elements to avoid additional temporary arrays
+            score_buffer = np.empty((2, y.shape[0]))
+            v_hat = np.subtract(d, m_hat, out=score_buffer[0])
             if self.score == 'IV-type':
-                psi_a = - np.multiply(v_hat, d)
-                psi_b = np.multiply(v_hat, y - g_hat)
+                u_hat = np.subtract(y, g_hat, out=score_buffer[1])
+                psi_b = np.multiply(v_hat, u_hat, out=u_hat)
+                psi_a = np.multiply(v_hat, d, out=v_hat)
             else:
                 assert self.score == 'partialling out'
-                u_hat = y - l_hat
-                psi_a = -np.multiply(v_hat, v_hat)
-                psi_b = np.multiply(v_hat, u_hat)
+                u_hat = np.subtract(y, l_hat, out=score_buffer[1])
+                psi_b = np.multiply(v_hat, u_hat, out=u_hat)
+                psi_a = np.square(v_hat, out=v_hat)
+            np.negative(psi_a, out=psi_a)
         else:
             assert callable(self.score)
             psi_a, psi_b = self.score(y=y, d=d,
@@ -279,10 +349,12 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
 
         m_hat = preds['predictions']['ml_m']
         theta = self.all_coef[self._i_treat, self._i_rep]
+        # the treatment residual enters nu2 and, for the partialling out score, also sigma2; it is computed once
+        v_hat = d - m_hat
 
         if self.score == 'partialling out':
             l_hat = preds['predictions']['ml_l']
-            sigma2_score_element = np.square(y - l_hat - np.multiply(theta, d-m_hat))
+            sigma2_score_element = np.square(y - l_hat - np.multiply(theta, v_hat))
         else:
             assert self.score == 'IV-type'
             g_hat = preds['predictions']['ml_g']
@@ -291,8 +363,9 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         sigma2 = np.mean(sigma2_score_element)
         psi_sigma2 = sigma2_score_element - sigma2
 
-        nu2 = np.divide(1.0, np.mean(np.square(d - m_hat)))
-        psi_nu2 = nu2 - np.multiply(np.square(d-m_hat), np.square(nu2))
+        v_hat_squared = np.square(v_hat, out=v_hat)
+        nu2 = np.divide(1.0, np.mean(v_hat_squared))
+        psi_nu2 = nu2 - np.multiply(v_hat_squared, np.square(nu2))
 
         element_dict = {'sigma2': sigma2,
                         'nu2': nu2,
@@ -304,21 +377,23 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                          search_mode, n_iter_randomized_search):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
-        x, d = check_X_y(x, self._dml_data.d,
-                         force_all_finite=False)
+        d = _check_target(self._dml_data.d, x)
 
         if scoring_methods is None:
             scoring_methods = {'ml_l': None,
                                'ml_m': None,
                                'ml_g': None}
 
+        # the nuisance learners l and m do not depend on each other and are tuned in parallel
         train_inds = [train_index for (train_index, _) in smpls]
-        l_tune_res = _dml_tune(y, x, train_inds,
-                               self._learner['ml_l'], param_grids['ml_l'], scoring_methods['ml_l'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
-        m_tune_res = _dml_tune(d, x, train_inds,
-                               self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+        tune_keys = ['ml_l', 'ml_m']
+        all_tune_res = _dml_tune_multi({'ml_l': y, 'ml_m': d}, x, train_inds,
+                                       {key: self._learner[key] for key in tune_keys},
+                                       {key: param_grids[key] for key in tune_keys},
+                                       {key: scoring_methods[key] for key in tune_keys},
+                                       n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+        l_tune_res = all_tune_res['ml_l']
+        m_tune_res = all_tune_res['ml_m']
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
         m_best_params = [xx.best_params_ for xx in m_tune_res]
@@ -329,11 +404,11 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             l_hat = np.full_like(y, np.nan)
             m_hat = np.full_like(d, np.nan)
             for idx, (train_index, _) in enumerate(smpls):
-                l_hat[train_index] = l_tune_res[idx].predict(x[train_index, :])
-                m_hat[train_index] = m_tune_res[idx].predict(x[train_index, :])
-            psi_a = -np.multiply(d - m_hat, d - m_hat)
-            psi_b = np.multiply(d - m_hat, y - l_hat)
-            theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
+                x_train = x[train_index, :]
+                l_hat[train_index] = l_tune_res[idx].predict(x_train)
+                m_hat[train_index] = m_tune_res[idx].predict(x_train)
+            v_hat = d - m_hat
+            theta_initial = np.nanmean(np.multiply(v_hat, y - l_hat)) / np.nanmean(np.square(v_hat))
             g_tune_res = _dml_tune(y - theta_initial*d, x, train_inds,
                                    self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
@@ -57,15 +57,30 @@ class LinearScoreMixin:
             assert scaling_factor is not None
             assert inds is None
             # if we have clustered data and dml2 the solution is the root of a weighted sum
-            psi_a_subsample_mean = 0.
-            psi_b_subsample_mean = 0.
-            for i_fold, (_, test_index) in enumerate(smpls):
-                psi_a_subsample_mean += scaling_factor[i_fold] * np.sum(psi_a[test_index])
-                psi_b_subsample_mean += scaling_factor[i_fold] * np.sum(psi_b[test_index])
-            coef = -psi_b_subsample_mean / psi_a_subsample_mean
+            psi_a_sums, psi_b_sums = self._fold_sums({'psi_a': psi_a, 'psi_b': psi_b}, smpls)
+            coef = -np.dot(scaling_factor, psi_b_sums) / np.dot(scaling_factor, psi_a_sums)
 
         return coef
 
+    def _est_dml1_coefs(self, psi_elements, smpls):
+        psi_a_sums, psi_b_sums = self._fold_sums(psi_elements, smpls)
+        dml1_coefs = - psi_b_sums / psi_a_sums
+
+        return dml1_coefs
+
+    @staticmethod
+    def _fold_sums(psi_elements, smpls):
+        # the fold-wise sums of the score elements are computed in one pass over all observations
+        # observations not contained in any test sample (no cross-fitting) are collected in an additional bin
+        n_folds = len(smpls)
+        fold_ids = np.full(psi_elements['psi_a'].shape[0], n_folds)
+        for idx, (_, test_index) in enumerate(smpls):
+            fold_ids[test_index] = idx
+        psi_a_sums = np.bincount(fold_ids, weights=psi_elements['psi_a'], minlength=n_folds + 1)[:n_folds]
+        psi_b_sums = np.bincount(fold_ids, weights=psi_elements['psi_b'], minlength=n_folds + 1)[:n_folds]
+
+        return psi_a_sums, psi_b_sums
+
 
 class NonLinearScoreMixin:
     """Mixin class implementing DML estimation for score functions being nonlinear in the target parameter
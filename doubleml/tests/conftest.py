@@ -12,7 +12,7 @@ from doubleml.datasets import make_plr_turrell2018, make_irm_data, make_iivm_dat
 
 
 def _g(x):
-    return np.power(np.sin(x), 2)
+    return np.square(np.sin(x))
 
 
 def _m(x, nu=0., gamma=1.):
@@ -20,7 +20,7 @@ def _m(x, nu=0., gamma=1.):
 
 
 def _m2(x):
-    return np.power(x, 2)
+    return np.square(x)
 
 
 @pytest.fixture(scope='session',
@@ -71,9 +71,10 @@ def generate_data_bivariate(request):
 
     # generating data
     x = np.random.multivariate_normal(np.zeros(p), sigma, size=[n, ])
-    G = _g(np.dot(x, b))
-    M0 = _m(np.dot(x, b))
-    M1 = _m2(np.dot(x, b))
+    xb = np.dot(x, b)
+    G = _g(xb)
+    M0 = _m(xb)
+    M1 = _m2(xb)
     D0 = M0 + np.random.standard_normal(size=[n, ])
     D1 = M1 + np.random.standard_normal(size=[n, ])
     y = theta[0] * D0 + theta[1] * D1 + G + np.random.standard_normal(size=[n, ])
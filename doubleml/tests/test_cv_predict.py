@@ -6,7 +6,7 @@ from sklearn.model_selection import KFold, train_test_split
 from sklearn.linear_model import Lasso, LogisticRegression
 
 from ._utils_dml_cv_predict import _dml_cv_predict_ut_version
-from doubleml._utils import _dml_cv_predict
+from doubleml._utils import _dml_cv_predict, _dml_cv_predict_multi
 
 
 @pytest.fixture(scope='module',
@@ -61,16 +61,28 @@ def cv_predict_fixture(generate_data_cv_predict, cross_fit, params):
                 est_params = {'alpha': 1.}
 
     if method == 'predict_proba':
-        preds = _dml_cv_predict(LogisticRegression(), x, y, smpls,
+        learner = LogisticRegression()
+        preds = _dml_cv_predict(learner, x, y, smpls,
                                 est_params=est_params, method=method)
-        preds_ut = _dml_cv_predict_ut_version(LogisticRegression(), x, y, smpls,
+        preds_ut = _dml_cv_predict_ut_version(learner, x, y, smpls,
                                               est_params=est_params, method=method)[:, 1]
     else:
-        preds = _dml_cv_predict(Lasso(), x, y, smpls, est_params=est_params, method=method)
-        preds_ut = _dml_cv_predict_ut_version(Lasso(), x, y, smpls, est_params=est_params, method=method)
+        learner = Lasso()
+        preds = _dml_cv_predict(learner, x, y, smpls, est_params=est_params, method=method)
+        preds_ut = _dml_cv_predict_ut_version(learner, x, y, smpls, est_params=est_params, method=method)
+
+    # parallel cross-fitting of a single and several learners
+    preds_n_jobs = _dml_cv_predict(learner, x, y, smpls, n_jobs=2, est_params=est_params, method=method)
+    preds_multi = _dml_cv_predict_multi({'a': learner, 'b': learner}, x, {'a': y, 'b': y}, smpls, n_jobs=2,
+                                        est_params={'a': est_params, 'b': None},
+                                        methods={'a': method, 'b': method})
+    preds_multi_b = _dml_cv_predict(learner, x, y, smpls, method=method)
 
     res_dict = {'preds': preds['preds'],
-                'preds_ut': preds_ut}
+                'preds_ut': preds_ut,
+                'preds_n_jobs': preds_n_jobs['preds'],
+                'preds_multi': {key: preds_multi[key]['preds'] for key in preds_multi},
+                'preds_multi_b': preds_multi_b['preds']}
 
     return res_dict
 
@@ -83,3 +95,19 @@ def test_cv_predict(cv_predict_fixture):
     assert np.allclose(cv_predict_fixture['preds'][~ind_nan_preds],
                        cv_predict_fixture['preds_ut'][~ind_nan_preds],
                        rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_cv_predict_n_jobs(cv_predict_fixture):
+    ind_nan_preds = np.isnan(cv_predict_fixture['preds'])
+    assert np.array_equal(ind_nan_preds, np.isnan(cv_predict_fixture['preds_n_jobs']))
+    assert np.allclose(cv_predict_fixture['preds'][~ind_nan_preds],
+                       cv_predict_fixture['preds_n_jobs'][~ind_nan_preds],
+                       rtol=1e-9, atol=1e-4)
+    assert np.array_equal(ind_nan_preds, np.isnan(cv_predict_fixture['preds_multi']['a']))
+    assert np.allclose(cv_predict_fixture['preds'][~ind_nan_preds],
+                       cv_predict_fixture['preds_multi']['a'][~ind_nan_preds],
+                       rtol=1e-9, atol=1e-4)
+    assert np.allclose(cv_predict_fixture['preds_multi_b'][~ind_nan_preds],
+                       cv_predict_fixture['preds_multi']['b'][~ind_nan_preds],
+                       rtol=1e-9, atol=1e-4)
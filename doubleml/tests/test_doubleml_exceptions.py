@@ -620,6 +620,9 @@ def test_doubleml_exception_resampling():
     msg = 'draw_sample_splitting must be True or False. Got true.'
     with pytest.raises(TypeError, match=msg):
         _ = DoubleMLPLR(dml_data, ml_l, ml_m, draw_sample_splitting='true')
+    msg = 'merge_nuisance must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        _ = DoubleMLPLR(dml_data, ml_l, ml_m, merge_nuisance=1)
 
 
 @pytest.mark.ci
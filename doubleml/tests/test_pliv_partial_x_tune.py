@@ -4,7 +4,7 @@ import math
 
 from sklearn.base import clone
 
-from sklearn.linear_model import ElasticNet
+from sklearn.linear_model import ElasticNet, Ridge
 from sklearn.ensemble import RandomForestRegressor
 
 import doubleml as dml
@@ -169,3 +169,34 @@ def test_dml_pliv_boot(dml_pliv_partial_x_fixture):
         assert np.allclose(dml_pliv_partial_x_fixture['boot_t_stat' + bootstrap],
                            dml_pliv_partial_x_fixture['boot_t_stat' + bootstrap + '_manual'],
                            rtol=1e-9, atol=1e-4)
+
+
+@pytest.fixture(scope='module',
+                params=[(Ridge(), {'alpha': np.logspace(0, 4, 9)}, 2),
+                        (RandomForestRegressor(n_estimators=5), {'max_depth': [2, 3, 5, 10]}, 1)])
+def learner_n_jobs(request):
+    # Ridge does not draw from the global random state when fitted, such that tuning in parallel reproduces
+    # sequential tuning; random forests do, such that only n_jobs_cv=1 reproduces n_jobs_cv=None
+    return request.param
+
+
+@pytest.mark.ci
+def test_dml_pliv_tune_n_jobs(generate_data_pliv_partialX, tune_on_folds, learner_n_jobs):
+    learner, learner_par_grid, n_jobs = learner_n_jobs
+    par_grid = {'ml_l': learner_par_grid,
+                'ml_m': learner_par_grid,
+                'ml_r': learner_par_grid}
+
+    res = []
+    for n_jobs_cv in [None, n_jobs]:
+        np.random.seed(3141)
+        dml_pliv_obj = dml.DoubleMLPLIV._partialX(generate_data_pliv_partialX,
+                                                  clone(learner), clone(learner), clone(learner),
+                                                  n_folds=2)
+        dml_pliv_obj.tune(par_grid, tune_on_folds=tune_on_folds, n_folds_tune=4, n_jobs_cv=n_jobs_cv)
+        dml_pliv_obj.fit(n_jobs_cv=n_jobs_cv)
+        res.append(dml_pliv_obj)
+
+    assert res[0].params == res[1].params
+    assert np.allclose(res[0].coef, res[1].coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(res[0].se, res[1].se, rtol=1e-9, atol=1e-4)
@@ -7,7 +7,7 @@ import pandas as pd
 from sklearn.base import clone
 
 from sklearn.linear_model import LinearRegression, Lasso
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 
 import doubleml as dml
 
@@ -16,7 +16,7 @@ from ._utils_plr_manual import fit_plr, plr_dml1, plr_dml2, boot_plr, fit_sensit
 
 
 @pytest.fixture(scope='module',
-                params=[RandomForestRegressor(max_depth=2, n_estimators=10),
+                params=[RandomForestRegressor(max_depth=2, n_estimators=10, n_jobs=-1),
                         LinearRegression(),
                         Lasso(alpha=0.1)])
 def learner(request):
@@ -375,3 +375,71 @@ def test_dml_plr_cate_gate(score, dml_procedure):
     assert isinstance(gate_2, dml.double_ml_blp.DoubleMLBLP)
     assert isinstance(gate_2.confint(), pd.DataFrame)
     assert all(gate_2.confint().index == ["Group_1", "Group_2"])
+
+
+@pytest.mark.ci
+def test_dml_plr_merge_nuisance(generate_data1, score, dml_procedure):
+    data = generate_data1
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d'], x_cols)
+
+    # for linear regression the joint multi-output fit coincides with separate fits of l and m
+    learner = LinearRegression()
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data,
+                                  clone(learner), clone(learner), clone(learner),
+                                  n_folds=2,
+                                  score=score,
+                                  dml_procedure=dml_procedure)
+    dml_plr_obj.fit()
+
+    dml_plr_obj_merged = dml.DoubleMLPLR(obj_dml_data,
+                                         clone(learner), clone(learner), clone(learner),
+                                         n_folds=2,
+                                         score=score,
+                                         dml_procedure=dml_procedure,
+                                         draw_sample_splitting=False,
+                                         merge_nuisance=True)
+    dml_plr_obj_merged.set_sample_splitting(dml_plr_obj.smpls)
+    assert dml_plr_obj_merged.merge_nuisance
+    dml_plr_obj_merged.fit(store_models=True)
+
+    for learner_name in ['ml_l', 'ml_m']:
+        assert np.allclose(dml_plr_obj.predictions[learner_name],
+                           dml_plr_obj_merged.predictions[learner_name],
+                           rtol=1e-9, atol=1e-4)
+    assert dml_plr_obj_merged.models['ml_l']['d'][0] is dml_plr_obj_merged.models['ml_m']['d'][0]
+    assert np.allclose(dml_plr_obj.coef, dml_plr_obj_merged.coef,
+                       rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_plr_obj.se, dml_plr_obj_merged.se,
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_merge_nuisance_single_output(generate_data1):
+    data = generate_data1
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    obj_dml_data = dml.DoubleMLData(data, 'y', ['d'], x_cols)
+
+    # learners without multi-output support are fitted separately
+    learner = GradientBoostingRegressor(n_estimators=10, random_state=42)
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data,
+                                  clone(learner), clone(learner),
+                                  n_folds=2)
+    dml_plr_obj.fit()
+
+    dml_plr_obj_merged = dml.DoubleMLPLR(obj_dml_data,
+                                         clone(learner), clone(learner),
+                                         n_folds=2,
+                                         draw_sample_splitting=False,
+                                         merge_nuisance=True)
+    dml_plr_obj_merged.set_sample_splitting(dml_plr_obj.smpls)
+    dml_plr_obj_merged.fit()
+
+    for learner_name in ['ml_l', 'ml_m']:
+        assert np.allclose(dml_plr_obj.predictions[learner_name],
+                           dml_plr_obj_merged.predictions[learner_name],
+                           rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_plr_obj.coef, dml_plr_obj_merged.coef,
+                       rtol=1e-9, atol=1e-4)
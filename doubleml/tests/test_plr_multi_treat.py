@@ -3,6 +3,7 @@ import pytest
 
 from sklearn.linear_model import Lasso
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.neural_network import MLPRegressor
 
 import doubleml as dml
 
@@ -163,3 +164,64 @@ def test_dml_plr_multitreat_sensitivity_rho0(dml_plr_multitreat_fixture):
     assert np.allclose(dml_plr_multitreat_fixture['se'],
                        dml_plr_multitreat_fixture['sensitivity_ses']['upper'],
                        rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_multitreat_shared_l_hat(generate_data_bivariate, score, dml_procedure):
+    data = generate_data_bivariate
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    d_cols = data.columns[data.columns.str.startswith('d')].tolist()
+    learner = Lasso(alpha=0.1)
+
+    np.random.seed(3141)
+    obj_dml_data = dml.DoubleMLData(data, 'y', d_cols, x_cols, use_other_treat_as_covariate=False)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data,
+                                  _clone(learner), _clone(learner), _clone(learner),
+                                  n_folds=2, n_rep=2,
+                                  score=score,
+                                  dml_procedure=dml_procedure)
+    dml_plr_obj.fit()
+
+    # the predictions of ml_l are shared among the treatment variables, but not kept after fitting
+    for i_d in range(1, len(d_cols)):
+        assert np.array_equal(dml_plr_obj.predictions['ml_l'][:, :, 0],
+                              dml_plr_obj.predictions['ml_l'][:, :, i_d])
+    assert dml_plr_obj._l_hat_cache is None
+
+    # and coincide with separate fits for each treatment variable
+    for i_d, d_col in enumerate(d_cols):
+        obj_dml_data_single = dml.DoubleMLData(data, 'y', d_col, x_cols)
+        dml_plr_obj_single = dml.DoubleMLPLR(obj_dml_data_single,
+                                             _clone(learner), _clone(learner), _clone(learner),
+                                             n_folds=2, n_rep=2,
+                                             score=score,
+                                             dml_procedure=dml_procedure,
+                                             draw_sample_splitting=False)
+        dml_plr_obj_single.set_sample_splitting(dml_plr_obj.smpls)
+        dml_plr_obj_single.fit()
+        assert np.allclose(dml_plr_obj.coef[i_d], dml_plr_obj_single.coef,
+                           rtol=1e-9, atol=1e-4)
+        assert np.allclose(dml_plr_obj.se[i_d], dml_plr_obj_single.se,
+                           rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_multitreat_shared_l_hat_array_params(generate_data_bivariate):
+    data = generate_data_bivariate
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    d_cols = data.columns[data.columns.str.startswith('d')].tolist()
+    learner = MLPRegressor(max_iter=20, random_state=42)
+
+    np.random.seed(3141)
+    obj_dml_data = dml.DoubleMLData(data, 'y', d_cols, x_cols, use_other_treat_as_covariate=False)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data,
+                                  _clone(learner), _clone(learner),
+                                  n_folds=2)
+    # array-valued hyperparameters are compared element-wise when sharing the predictions of ml_l
+    for d_col in d_cols:
+        dml_plr_obj.set_ml_nuisance_params('ml_l', d_col, {'hidden_layer_sizes': np.array([5, 3])})
+    dml_plr_obj.fit()
+
+    for i_d in range(1, len(d_cols)):
+        assert np.array_equal(dml_plr_obj.predictions['ml_l'][:, :, 0],
+                              dml_plr_obj.predictions['ml_l'][:, :, i_d])
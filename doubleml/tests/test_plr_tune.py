@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 import math
 
-from sklearn.linear_model import Lasso, ElasticNet
+from sklearn.linear_model import Lasso, ElasticNet, Ridge
+from sklearn.ensemble import RandomForestRegressor
 
 import doubleml as dml
 
@@ -49,6 +50,12 @@ def tune_on_folds(request):
     return request.param
 
 
+@pytest.fixture(scope='module',
+                params=['grid_search', 'randomized_search'])
+def search_mode(request):
+    return request.param
+
+
 def get_par_grid(learner):
     if learner.__class__ == Lasso:
         par_grid = {'alpha': np.linspace(0.05, .95, 7)}
@@ -168,3 +175,36 @@ def test_dml_plr_boot(dml_plr_fixture):
         assert np.allclose(dml_plr_fixture['boot_t_stat' + bootstrap],
                            dml_plr_fixture['boot_t_stat' + bootstrap + '_manual'],
                            rtol=1e-9, atol=1e-4)
+
+
+@pytest.fixture(scope='module',
+                params=[(Ridge(), {'alpha': np.logspace(0, 4, 9)}, 2),
+                        (RandomForestRegressor(n_estimators=5), {'max_depth': [2, 3, 5, 10]}, 1)])
+def learner_n_jobs(request):
+    # Ridge does not draw from the global random state when fitted, such that tuning in parallel reproduces
+    # sequential tuning; random forests do, such that only n_jobs_cv=1 reproduces n_jobs_cv=None
+    return request.param
+
+
+@pytest.mark.ci
+def test_dml_plr_tune_n_jobs(generate_data2, score, tune_on_folds, search_mode, learner_n_jobs):
+    learner, learner_par_grid, n_jobs = learner_n_jobs
+    par_grid = {'ml_l': learner_par_grid,
+                'ml_m': learner_par_grid,
+                'ml_g': learner_par_grid}
+
+    res = []
+    for n_jobs_cv in [None, n_jobs]:
+        np.random.seed(3141)
+        dml_plr_obj = dml.DoubleMLPLR(generate_data2,
+                                      _clone(learner), _clone(learner), _clone(learner),
+                                      n_folds=2,
+                                      score=score)
+        dml_plr_obj.tune(par_grid, tune_on_folds=tune_on_folds, n_folds_tune=4, n_jobs_cv=n_jobs_cv,
+                         search_mode=search_mode, n_iter_randomized_search=4)
+        dml_plr_obj.fit(n_jobs_cv=n_jobs_cv)
+        res.append(dml_plr_obj)
+
+    assert res[0].params == res[1].params
+    assert np.allclose(res[0].coef, res[1].coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(res[0].se, res[1].se, rtol=1e-9, atol=1e-4)